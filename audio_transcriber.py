@@ -7,12 +7,22 @@ import time
 import json
 import tempfile
 import math
+import atexit
+import mmap
+import random
 import sys
-from pathlib import Path
+import shutil
+from datetime import datetime
+from functools import lru_cache
+import subprocess
 import logging
-from openai import OpenAI
-from mutagen import File as MutagenFile
-from pydub import AudioSegment
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional, faster config serialization
+except ImportError:
+    orjson = None
 
 # Configure logging for troubleshooting
 logging.basicConfig(
@@ -30,7 +40,251 @@ logging.info(f"Python executable: {sys.executable}")
 logging.info(f"Current working directory: {os.getcwd()}")
 logging.info(f"App is frozen: {getattr(sys, 'frozen', False)}")
 
+# Keep console windows from flashing up for ffmpeg/ffprobe in the windowed Windows build
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+def find_ffmpeg_tool(name):
+    """Find an FFmpeg tool bundled next to the frozen executable or on PATH"""
+    exe_name = f"{name}.exe" if os.name == 'nt' else name
+    if getattr(sys, 'frozen', False):
+        for base_dir in (getattr(sys, '_MEIPASS', ''), os.path.dirname(sys.executable)):
+            candidate = os.path.join(base_dir, exe_name)
+            if base_dir and os.path.exists(candidate):
+                return candidate
+    return shutil.which(name)
+
+@lru_cache(maxsize=None)
+def get_ffmpeg_path():
+    """Path to ffmpeg, or None if it is not available"""
+    return find_ffmpeg_tool("ffmpeg")
+
+@lru_cache(maxsize=None)
+def get_ffprobe_path():
+    """Path to ffprobe, or None if it is not available"""
+    return find_ffmpeg_tool("ffprobe")
+
+FFMPEG_PATH = get_ffmpeg_path()
+FFPROBE_PATH = get_ffprobe_path()
+logging.info(f"ffmpeg path: {FFMPEG_PATH or 'not found'}")
+logging.info(f"ffprobe path: {FFPROBE_PATH or 'not found'}")
+
+# Chunks are CBR MP3, so size is exactly bitrate * duration: 64 kbps = 8000 bytes/s
+CHUNK_BITRATE_KBPS = 64
+CHUNK_BYTES_PER_SECOND = CHUNK_BITRATE_KBPS * 1000 // 8
+
+# Opus (webm) can't encode below 6 kbps, the lowest of any supported format, so a file
+# smaller than this * duration limit can't be too long
+MIN_AUDIO_BYTES_PER_SECOND = 6000 // 8
+
+# The upload limit covers the whole multipart request, not just the audio, so chunks stay ~1 MB under it
+UPLOAD_HEADROOM_BYTES = 1024 * 1024
+
+# Extensions that are MPEG audio and can be cut at frame boundaries
+MP3_EXTENSIONS = frozenset({'.mp3', '.mpeg', '.mpga'})
+
+# The transcription model works on 16 kHz audio, so higher sample rates only add upload size
+CHUNK_SAMPLE_RATE = 16000
+
+# Never wait on stdin, only report errors, and let ffmpeg use all cores
+FFMPEG_INPUT_FLAGS = ["-nostdin", "-hide_banner", "-loglevel", "error", "-threads", "0"]
+
+_openai = None
+
+def get_openai_module():
+    """Import the OpenAI SDK on first use; it is slow to load and not needed to show the window"""
+    global _openai
+    if _openai is None:
+        import openai
+        _openai = openai
+    return _openai
+
+_AudioSegment = None
+
+def get_audio_segment_class():
+    """Import pydub on first use and configure its ffmpeg path exactly once"""
+    global _AudioSegment
+    if _AudioSegment is None:
+        from pydub import AudioSegment
+        if FFMPEG_PATH:
+            AudioSegment.converter = FFMPEG_PATH
+        _AudioSegment = AudioSegment
+    return _AudioSegment
+
+def _safe_stat(path):
+    """os.stat that returns None for missing files, so one syscall answers exists + size"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+_mutagen = None
+
+def get_mutagen_parsers():
+    """Import mutagen on first use; returns (generic File, {extension: format-specific parser})"""
+    global _mutagen
+    if _mutagen is None:
+        from mutagen import File as MutagenFile
+        from mutagen.mp3 import MP3
+        from mutagen.mp4 import MP4
+        from mutagen.wave import WAVE
+        # Format-specific parsers, so the generic File() doesn't sniff every format first
+        parsers = {'.mp3': MP3, '.mpeg': MP3, '.mpga': MP3, '.mp4': MP4, '.m4a': MP4, '.wav': WAVE}
+        _mutagen = (MutagenFile, parsers)
+    return _mutagen
+
+def _mutagen_duration(path):
+    """Read the duration from the file header with mutagen, or return None"""
+    MutagenFile, parsers = get_mutagen_parsers()
+    parser = parsers.get(os.path.splitext(path)[1].lower())
+    if parser is not None:
+        try:
+            return parser(path).info.length
+        except Exception:
+            pass  # Mislabelled extension, let the generic sniffing have a go
+    try:
+        audio_file = MutagenFile(path)
+    except Exception as e:
+        # Corrupt or unrecognised header; leave it to ffprobe or the size-only estimate
+        logging.warning(f"mutagen could not read {path}: {e}")
+        return None
+    if audio_file and hasattr(audio_file, 'info') and hasattr(audio_file.info, 'length'):
+        return audio_file.info.length
+    return None
+
+def _ffprobe_duration(path):
+    """Read the container duration with ffprobe without decoding any audio"""
+    if not FFPROBE_PATH:
+        return None
+    result = subprocess.run(
+        [FFPROBE_PATH, "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", path],
+        capture_output=True,
+        text=True,
+        creationflags=_CREATIONFLAGS
+    )
+    if result.returncode != 0:
+        logging.warning(f"ffprobe failed for {path}: {result.stderr.strip()}")
+        return None
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+def _probe_stream(path):
+    """Read codec, bitrate and channel count of the first audio stream with ffprobe"""
+    if not FFPROBE_PATH:
+        return None
+    result = subprocess.run(
+        [FFPROBE_PATH, "-v", "error", "-select_streams", "a:0", "-show_streams", "-of", "json", path],
+        capture_output=True,
+        text=True,
+        creationflags=_CREATIONFLAGS
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        stream = json.loads(result.stdout)["streams"][0]
+        return {
+            'codec_name': stream.get('codec_name'),
+            'bit_rate': int(stream.get('bit_rate', 0)),
+            'channels': int(stream.get('channels', 0))
+        }
+    except (ValueError, KeyError, IndexError):
+        return None
+
+def _is_compact_mp3(path, max_bit_rate):
+    """True if the file is already mono MP3 at or below max_bit_rate (bits/s)"""
+    stream = _probe_stream(path)
+    return bool(stream and stream['codec_name'] == 'mp3' and stream['channels'] == 1
+                and 0 < stream['bit_rate'] <= max_bit_rate)
+
+# MPEG audio bitrates in kbps, keyed by (is MPEG-1, layer) and indexed by the header's bitrate field
+_MP3_BITRATES_KBPS = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates keyed by the header's version field (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def _parse_mp3_frame_header(header):
+    """Return (frame length in bytes, frame duration in seconds) for an MPEG audio header, or None"""
+    if header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    
+    layer = 4 - layer_bits
+    is_mpeg1 = version == 3
+    bit_rate = _MP3_BITRATES_KBPS[(is_mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    
+    if layer == 1:
+        return (12 * bit_rate // sample_rate + padding) * 4, 384 / sample_rate
+    if layer == 3 and not is_mpeg1:
+        return 72 * bit_rate // sample_rate + padding, 576 / sample_rate
+    return 144 * bit_rate // sample_rate + padding, 1152 / sample_rate
+
+def _iter_mp3_frames(data):
+    """Yield (offset, length, duration) of each MPEG audio frame, skipping ID3v2 tags and junk"""
+    pos = 0
+    if data[:3] == b'ID3' and len(data) >= 10:
+        tag_size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+        pos = 10 + tag_size + (10 if data[5] & 0x10 else 0)
+    
+    end = len(data)
+    while pos + 4 <= end:
+        frame = _parse_mp3_frame_header(data[pos:pos + 4])
+        if frame is None or pos + frame[0] > end:
+            # Not a (complete) frame: resync on the next 0xFF byte
+            pos = data.find(b'\xff', pos + 1)
+            if pos == -1:
+                return
+            continue
+        yield pos, frame[0], frame[1]
+        pos += frame[0]
+
+def _drain_stderr(stream, stderr_tail):
+    """Read a subprocess's stderr to EOF, keeping only the most recent blocks"""
+    for block in iter(lambda: stream.read1(4096), b''):
+        stderr_tail.append(block)
+    stream.close()
+
+def _start_ffmpeg(cmd):
+    """Start ffmpeg with stderr drained into a bounded buffer (last ~64 KB)"""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 16,
+        creationflags=_CREATIONFLAGS
+    )
+    stderr_tail = deque(maxlen=16)
+    drain_thread = threading.Thread(target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True)
+    drain_thread.start()
+    return process, stderr_tail, drain_thread
+
+def _stderr_text(stderr_tail):
+    """Decode the buffered stderr tail for error messages"""
+    return b"".join(stderr_tail).decode('utf-8', errors='replace').strip()[-500:]
+
 class AudioTranscriberApp:
+    # Supported audio formats
+    SUPPORTED_FORMATS = frozenset({'.mp3', '.mp4', '.mpeg', '.mpga', '.m4a', '.wav', '.webm'})
+    _FORMATS_DISPLAY = ", ".join(ext[1:] for ext in sorted(SUPPORTED_FORMATS))
+    _FILE_TYPES = [
+        ("Audio Files", " ".join(f"*{ext}" for ext in sorted(SUPPORTED_FORMATS))),
+        ("All Files", "*.*")
+    ]
+    
     def __init__(self):
         try:
             # Configuration file path
@@ -49,6 +303,9 @@ class AudioTranscriberApp:
             # OpenAI limits
             self.max_file_size_mb = 25
             self.max_duration_seconds = 1400  # ~23 minutes
+            self.max_concurrent_uploads = 4  # Parallel chunk transcriptions
+            self.max_retries = 4  # Retries per chunk on rate limits, 5xx and connection errors
+            self.rpm_limit = 50  # Requests per minute; request starts are spaced to stay under it
             
             # Variables
             self.api_key = tk.StringVar()
@@ -56,9 +313,38 @@ class AudioTranscriberApp:
             self.output_directory = tk.StringVar()
             self.output_filename = tk.StringVar()
             self.is_transcribing = False
-            self.transcribed_text = ""
-            self.temp_files = []  # Track all temporary files for cleanup
-            self.client = None  # OpenAI client will be initialized when API key is set
+            self.transcript_path = None  # Last saved transcript, read back when copying to the clipboard
+            self.temp_dir = None  # Per-job directory holding all temporary chunks
+            self._ffmpeg_process = None  # Running ffmpeg segmenter, killed if the app exits mid-job
+            self._upload_executor = None  # Running job's chunk upload pool
+            self._cancel_event = threading.Event()  # Set when the window is closed mid-job
+            self._cleanup_lock = threading.Lock()
+            self._dirs_being_removed = set()  # Handed to background cleanup but not yet deleted
+            
+            # File manager used to show the output folder (no shell involved)
+            if os.name == 'nt':  # Windows
+                self._open_folder = os.startfile
+            else:  # macOS and Linux
+                folder_opener = "open" if sys.platform == "darwin" else "xdg-open"
+                self._open_folder = lambda path: subprocess.Popen(
+                    [folder_opener, path],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            self._client = None  # OpenAI client, created on first use from the saved key or by validate_api_key
+            self._saved_api_key = ""  # Key read from the config file, the only one used without validation
+            self._audio_meta_cache = {}  # (path, size, mtime) -> duration in seconds, oldest first
+            self.max_saved_durations = 32  # Most recent probes persisted in the config file
+            self._stat_cache = None  # path -> stat result, only while a job is being set up/run
+            self.progress_lock = threading.Lock()
+            self._rate_lock = threading.Lock()
+            self._next_request_time = 0.0  # time.monotonic() before which no new request may start
+            self.completed_chunks = 0
+            
+            # Latest status/progress from worker threads, applied at most once per ~50 ms
+            self._ui_lock = threading.Lock()
+            self._pending_status = None
+            self._pending_progress = None
+            self._ui_flush_scheduled = False
             
             # Set default filename with DD_MM_YY_HH:MM format
             self.set_default_filename()
@@ -68,25 +354,41 @@ class AudioTranscriberApp:
             
             self.setup_ui()
             
-            # Initialize OpenAI client if API key exists
+            # Don't leave chunks behind if the window is closed or the app exits mid-job
+            self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
+            atexit.register(self.cleanup_on_exit)
+            
+            # Load the OpenAI SDK off the UI thread if a saved key means we'll need it
             if self.api_key.get():
-                self.initialize_openai_client()
+                threading.Thread(target=get_openai_module, daemon=True).start()
             
-            # Supported audio formats
-            self.supported_formats = {
-                'mp3', 'mp4', 'mpeg', 'mpga', 'm4a', 'wav', 'webm'
-            }
+            # pydub is only needed when splitting without ffmpeg; load it off the UI thread
+            if not FFMPEG_PATH:
+                threading.Thread(target=get_audio_segment_class, daemon=True).start()
             
         except Exception as e:
             logging.error(f"Critical error in initialization: {e}")
             messagebox.showerror("Startup Error", f"Failed to start application: {e}")
             raise
     
-    def initialize_openai_client(self):
-        """Initialize OpenAI client with current API key"""
+    @property
+    def client(self):
+        """OpenAI client, created from the API key saved in the config on first access"""
+        if self._client is None and self._saved_api_key:
+            self.initialize_openai_client(self._saved_api_key)
+        return self._client
+    
+    @client.setter
+    def client(self, value):
+        self._client = value
+    
+    def initialize_openai_client(self, api_key=None):
+        """Initialize OpenAI client with the given API key, or the one currently entered"""
         try:
-            if self.api_key.get():
-                self.client = OpenAI(api_key=self.api_key.get())
+            api_key = api_key or self.api_key.get()
+            if api_key:
+                # Retries are handled by call_with_retry; SDK retries on top would multiply them
+                self.client = get_openai_module().OpenAI(api_key=api_key, max_retries=0)
                 logging.info("OpenAI client initialized successfully")
                 return True
             return False
@@ -107,7 +409,7 @@ class AudioTranscriberApp:
             return False
         
         # Test the API key by initializing client
-        old_client = self.client
+        old_client = self._client
         if self.initialize_openai_client():
             # Save the working API key
             self.save_config()
@@ -118,39 +420,65 @@ class AudioTranscriberApp:
             messagebox.showerror("Invalid API Key", "Could not connect to OpenAI with this API key.")
             return False
     
-    def get_audio_duration(self, file_path):
-        """Get audio duration using mutagen (no FFmpeg needed)"""
+    def get_audio_info(self, file_path):
+        """Get (size in MB, duration in seconds, error) for an absolute path from one stat and a cached header probe"""
+        file_size_mb = None
         try:
-            abs_file_path = os.path.abspath(file_path)
-            logging.info(f"Getting duration for file: {abs_file_path}")
-            
-            if not os.path.exists(abs_file_path):
-                return None, f"Audio file does not exist: {abs_file_path}"
-            
-            # Use mutagen to read audio metadata
-            audio_file = MutagenFile(abs_file_path)
-            if audio_file and hasattr(audio_file, 'info') and hasattr(audio_file.info, 'length'):
-                duration = audio_file.info.length
-                logging.info(f"Audio duration: {duration:.2f} seconds ({duration/60:.1f} minutes)")
-                return duration, None
-            else:
-                return None, "Could not read audio metadata"
+            st = self.cached_stat(file_path)
+            if st is None:
+                return None, None, f"Audio file does not exist: {file_path}"
+            file_size_mb = st.st_size / (1024 * 1024)
+            
+            # Reuse the duration if this exact file version was probed before
+            cache_key = (file_path, st.st_size, st.st_mtime)
+            if cache_key in self._audio_meta_cache:
+                # Move to the end so the most recently used entries are the ones saved
+                duration = self._audio_meta_cache.pop(cache_key)
+                self._audio_meta_cache[cache_key] = duration
+                return file_size_mb, duration, None
+            
+            # Use mutagen to read audio metadata (header only, no decoding)
+            duration = _mutagen_duration(file_path)
+            if duration is None:
+                # Mutagen can't parse every container (e.g. webm), ask ffprobe instead
+                duration = _ffprobe_duration(file_path)
+                if duration is None:
+                    return file_size_mb, None, "Could not read audio metadata"
+            
+            logging.info(f"Audio duration for {file_path}: {duration:.2f} seconds ({duration/60:.1f} minutes)")
+            self._audio_meta_cache[cache_key] = duration
+            return file_size_mb, duration, None
                 
         except Exception as e:
             error_msg = f"Failed to get audio duration: {str(e)}"
             logging.error(error_msg)
-            return None, error_msg
+            # Keep the size if the stat succeeded, so callers can still fall back to a size-only check
+            return file_size_mb, None, error_msg
+    
+    def cached_stat(self, path):
+        """Stat a path at most once per transcription job (uncached outside a job)"""
+        stat_cache = self._stat_cache
+        if stat_cache is None:
+            return _safe_stat(path)
+        if path not in stat_cache:
+            stat_cache[path] = _safe_stat(path)
+        return stat_cache[path]
     
     def needs_splitting(self, file_path):
         """Check if file needs splitting based on size and duration"""
         try:
-            abs_file_path = os.path.abspath(file_path)
-            
-            # Check file size
-            file_size_mb = os.path.getsize(abs_file_path) / (1024 * 1024)
-            
-            # Check duration using mutagen
-            duration, error = self.get_audio_duration(abs_file_path)
+            # Small enough that even the lowest possible bitrate keeps it under both limits: skip the probe
+            st = self.cached_stat(file_path)
+            probe_free_bytes = min(self.max_duration_seconds * MIN_AUDIO_BYTES_PER_SECOND, self.max_file_size_mb * 1024 * 1024)
+            if st is not None and st.st_size <= probe_free_bytes:
+                file_size_mb = st.st_size / (1024 * 1024)
+                logging.info(f"File analysis: {file_size_mb:.1f}MB, too small to exceed limits, needs_split: False")
+                return False, file_size_mb, None, None
+            
+            # Check file size and duration
+            file_size_mb, duration, error = self.get_audio_info(file_path)
+            if file_size_mb is None:
+                return False, 0, 0, error
             if error:
                 logging.warning(f"Duration check failed, using size-only: {error}")
                 # Estimate based on typical MP3 bitrate (128kbps = ~1MB per minute)
@@ -167,9 +495,7 @@ class AudioTranscriberApp:
     
     def set_default_filename(self):
         """Set default filename with DD_MM_YY_HH:MM format"""
-        now = time.localtime()
-        default_name = f"transcription_{now.tm_mday:02d}_{now.tm_mon:02d}_{now.tm_year % 100:02d}_{now.tm_hour:02d}:{now.tm_min:02d}"
-        self.output_filename.set(default_name)
+        self.output_filename.set(datetime.now().strftime("transcription_%d_%m_%y_%H:%M"))
     
     def load_config(self):
         """Load configuration from file or set defaults"""
@@ -177,15 +503,21 @@ class AudioTranscriberApp:
             config_path = os.path.abspath(self.config_file)
             
             if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    data = f.read()
+                    config = orjson.loads(data) if orjson else json.loads(data)
                     
                     # Load API key
                     saved_api_key = config.get('api_key', '')
                     if saved_api_key:
                         self.api_key.set(saved_api_key)
+                        self._saved_api_key = saved_api_key
                         logging.info("Loaded saved API key")
                     
+                    # Load durations probed in earlier sessions
+                    for path, size, mtime, duration in config.get('duration_cache', []):
+                        self._audio_meta_cache[(path, size, mtime)] = duration
+                    
                     # Load output directory
                     saved_output_dir = config.get('output_directory', '')
                     if saved_output_dir and os.path.exists(saved_output_dir):
@@ -209,75 +541,210 @@ class AudioTranscriberApp:
     def save_config(self):
         """Save current configuration to file"""
         try:
+            recent_durations = list(self._audio_meta_cache.items())[-self.max_saved_durations:]
             config = {
                 'api_key': self.api_key.get(),
-                'output_directory': self.output_directory.get()
+                'output_directory': self.output_directory.get(),
+                'duration_cache': [[path, size, mtime, duration] for (path, size, mtime), duration in recent_durations]
             }
+            if orjson:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config, indent=2).encode('utf-8')
+            
+            # Write to a temp file and swap it in, so a crash can't leave a half-written config
             config_path = os.path.abspath(self.config_file)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            tmp_path = config_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, config_path)
             logging.info("Configuration saved")
         except Exception as e:
             logging.warning(f"Could not save configuration: {e}")
     
-    def split_mp3_file(self, input_path, max_duration_seconds=1350):
-        """Split MP3 file into chunks using pydub (no FFmpeg required)"""
+    def get_max_chunk_bytes(self):
+        """Largest chunk file to upload, leaving room for the rest of the request body"""
+        return self.max_file_size_mb * 1024 * 1024 - UPLOAD_HEADROOM_BYTES
+    
+    def get_segment_time(self, max_duration_seconds=1350):
+        """Longest chunk in seconds that fits both the duration and size limits at 64 kbps"""
+        max_size_bytes = self.get_max_chunk_bytes()
+        size_limit_seconds = max_size_bytes // CHUNK_BYTES_PER_SECOND
+        segment_time = min(max_duration_seconds, size_limit_seconds)
+        assert segment_time * CHUNK_BYTES_PER_SECOND <= max_size_bytes
+        return segment_time
+    
+    def stream_mp3_chunks(self, input_path, output_dir, max_duration_seconds=1350):
+        """Yield MP3 chunk paths as soon as ffmpeg finishes writing each segment"""
+        segment_time = self.get_segment_time(max_duration_seconds)
+        chunk_prefix = os.path.join(output_dir, "chunk_")
+        
+        # Already compact MP3 can be cut without re-encoding
+        if _is_compact_mp3(input_path, CHUNK_BITRATE_KBPS * 1000):
+            codec_args = ["-c:a", "copy"]
+        else:
+            codec_args = ["-ac", "1", "-ar", str(CHUNK_SAMPLE_RATE), "-c:a", "libmp3lame", "-b:a", f"{CHUNK_BITRATE_KBPS}k"]
+        
+        logging.info(f"Segmenting {input_path} with ffmpeg ({' '.join(codec_args)}) into chunks of max {segment_time}s")
+        
+        # One decode pass; ffmpeg writes each segment to disk as it goes
+        cmd = [FFMPEG_PATH, *FFMPEG_INPUT_FLAGS, "-i", input_path,
+               "-vn", *codec_args,
+               "-f", "segment", "-segment_time", str(segment_time), "-reset_timestamps", "1",
+               "-y", chunk_prefix + "%03d.mp3"]
+        
+        process, stderr_tail, drain_thread = _start_ffmpeg(cmd)
+        self._ffmpeg_process = process
+        
         try:
-            abs_input_path = os.path.abspath(input_path)
-            logging.info(f"Splitting audio file: {abs_input_path}")
+            index = 0
+            while True:
+                finished = process.poll() is not None
+                chunk_path = f"{chunk_prefix}{index:03d}.mp3"
+                next_chunk_path = f"{chunk_prefix}{index + 1:03d}.mp3"
+                
+                # The segment muxer only opens segment N+1 once segment N is complete
+                chunk_stat = None
+                if finished or os.path.exists(next_chunk_path):
+                    chunk_stat = _safe_stat(chunk_path)
+                
+                if chunk_stat is not None:
+                    if finished and process.returncode != 0:
+                        break
+                    
+                    chunk_size_mb = chunk_stat.st_size / (1024 * 1024)
+                    logging.info(f"Created chunk {index+1}: {chunk_size_mb:.1f} MB")
+                    yield chunk_path
+                    index += 1
+                elif finished:
+                    break
+                else:
+                    time.sleep(0.25)
+            
+            if process.returncode != 0:
+                drain_thread.join()
+                raise RuntimeError(f"ffmpeg segmenting failed: {_stderr_text(stderr_tail)}")
+            if index == 0:
+                raise RuntimeError("ffmpeg did not produce any chunks")
+        
+        finally:
+            # Stop ffmpeg if the consumer gave up early
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            self._ffmpeg_process = None
+    
+    def stream_mp3_chunks_by_frames(self, input_path, output_dir, max_duration_seconds=1350):
+        """Yield MP3 chunks cut at frame boundaries by copying bytes (no decoding, no ffmpeg)"""
+        max_chunk_bytes = self.get_max_chunk_bytes()
+        logging.info(f"Splitting MP3 at frame boundaries: {input_path}")
+        
+        with open(input_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise RuntimeError("No MP3 audio frames found")
+            # Map the file instead of reading it into memory; chunks are copied straight from the mapping
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data, memoryview(data) as view:
+                index = 0
+                chunk_start = chunk_end = None
+                chunk_seconds = 0.0
+                first_frame = True
+                
+                for offset, length, frame_seconds in _iter_mp3_frames(data):
+                    if first_frame:
+                        first_frame = False
+                        # A Xing/Info/VBRI frame describes the whole file; don't copy it into chunk 1
+                        if any(data.find(tag, offset, offset + length) != -1 for tag in (b'Xing', b'Info', b'VBRI')):
+                            continue
+                    
+                    if chunk_start is None:
+                        chunk_start = offset
+                    elif (chunk_seconds + frame_seconds > max_duration_seconds
+                            or offset + length - chunk_start > max_chunk_bytes):
+                        # Release the slice even if the write fails, or closing the mmap raises BufferError
+                        with view[chunk_start:chunk_end] as chunk_bytes:
+                            chunk_path = self.write_mp3_chunk(chunk_bytes, output_dir, index, chunk_seconds)
+                        yield chunk_path
+                        index += 1
+                        chunk_start = offset
+                        chunk_seconds = 0.0
+                    
+                    chunk_end = offset + length
+                    chunk_seconds += frame_seconds
+                
+                if chunk_start is None:
+                    raise RuntimeError("No MP3 audio frames found")
+                with view[chunk_start:chunk_end] as chunk_bytes:
+                    chunk_path = self.write_mp3_chunk(chunk_bytes, output_dir, index, chunk_seconds)
+                yield chunk_path
+    
+    def write_mp3_chunk(self, chunk_bytes, output_dir, index, chunk_seconds):
+        """Write raw MP3 frames to chunk_NNN.mp3 and return its path"""
+        chunk_path = os.path.join(output_dir, f"chunk_{index:03d}.mp3")
+        with open(chunk_path, 'wb') as f:
+            f.write(chunk_bytes)
+        logging.info(f"Created chunk {index+1}: {len(chunk_bytes) / (1024 * 1024):.1f} MB, {chunk_seconds:.1f}s")
+        return chunk_path
+    
+    def stream_wav_chunks_pydub(self, input_path, output_dir, max_duration_seconds=1350):
+        """Yield WAV chunk paths one at a time using pydub (fallback when ffmpeg isn't found)"""
+        logging.info(f"Splitting audio file: {input_path}")
+        
+        # Load the audio file with pydub, downmix and resample; speech transcription needs neither stereo nor >16 kHz
+        audio = get_audio_segment_class().from_file(input_path).set_channels(1)
+        if audio.frame_rate > CHUNK_SAMPLE_RATE:
+            audio = audio.set_frame_rate(CHUNK_SAMPLE_RATE)
+        total_duration_ms = len(audio)
+        total_duration_seconds = total_duration_ms / 1000.0
+        
+        # Without ffmpeg pydub can only write uncompressed WAV, so chunks are sized to fit the upload limit
+        bytes_per_second = audio.frame_rate * audio.sample_width * audio.channels
+        max_wav_seconds = (self.get_max_chunk_bytes() - 1024) // bytes_per_second  # 1KB for the header
+        max_duration_seconds = min(max_duration_seconds, max_wav_seconds)
+        
+        # Calculate number of chunks needed (integer milliseconds, so no float rounding at boundaries)
+        step_ms = int(max_duration_seconds) * 1000
+        num_chunks = -(-total_duration_ms // step_ms)
+        
+        logging.info(f"Splitting {total_duration_seconds:.1f}s audio into {num_chunks} chunks of max {max_duration_seconds}s each")
+        
+        for i, start_ms in enumerate(range(0, total_duration_ms, step_ms)):
+            end_ms = min(start_ms + step_ms, total_duration_ms)
             
-            # Load the audio file with pydub (works natively with MP3)
-            audio = AudioSegment.from_file(abs_input_path)
-            total_duration_ms = len(audio)
-            total_duration_seconds = total_duration_ms / 1000.0
+            # Extract chunk
+            chunk = audio[start_ms:end_ms]
+            chunk_duration_seconds = len(chunk) / 1000.0
             
-            # Calculate number of chunks needed
-            num_chunks = math.ceil(total_duration_seconds / max_duration_seconds)
+            # Create temporary file for chunk
+            chunk_abs_path = os.path.join(output_dir, f"chunk_{i:03d}.wav")
             
-            chunks = []
-            temp_dir = os.path.abspath(tempfile.gettempdir())
+            logging.info(f"Creating chunk {i+1}: {chunk_abs_path}")
             
-            logging.info(f"Splitting {total_duration_seconds:.1f}s audio into {num_chunks} chunks of max {max_duration_seconds}s each")
+            # Export chunk as WAV (written by pydub itself, no encoder needed)
+            chunk.export(chunk_abs_path, format="wav")
             
-            for i in range(num_chunks):
-                start_ms = i * max_duration_seconds * 1000
-                end_ms = min((i + 1) * max_duration_seconds * 1000, total_duration_ms)
-                
-                # Extract chunk
-                chunk = audio[start_ms:end_ms]
-                chunk_duration_seconds = len(chunk) / 1000.0
-                
-                # Create temporary file for chunk
-                chunk_filename = f"mp3_chunk_{int(time.time())}_{i+1}.mp3"
-                chunk_path = os.path.join(temp_dir, chunk_filename)
-                chunk_abs_path = os.path.abspath(chunk_path)
-                
-                logging.info(f"Creating chunk {i+1}: {chunk_abs_path}")
-                
-                # Export chunk as MP3 (pydub can do this without FFmpeg for MP3)
-                chunk.export(chunk_abs_path, format="mp3", bitrate="128k")
-                
-                # Verify chunk was created
-                if not os.path.exists(chunk_abs_path):
-                    return None, f"Failed to create chunk {i+1} at {chunk_abs_path}"
-                
-                chunk_size_mb = os.path.getsize(chunk_abs_path) / (1024 * 1024)
-                chunks.append(chunk_abs_path)
-                self.temp_files.append(chunk_abs_path)
-                
-                logging.info(f"Created chunk {i+1}/{num_chunks}: {chunk_size_mb:.1f} MB, {chunk_duration_seconds:.1f}s")
+            # Verify chunk was created
+            chunk_stat = _safe_stat(chunk_abs_path)
+            if chunk_stat is None:
+                raise RuntimeError(f"Failed to create chunk {i+1} at {chunk_abs_path}")
             
-            return chunks, None
+            chunk_size_mb = chunk_stat.st_size / (1024 * 1024)
+            logging.info(f"Created chunk {i+1}/{num_chunks}: {chunk_size_mb:.1f} MB, {chunk_duration_seconds:.1f}s")
             
-        except Exception as e:
-            error_msg = f"Failed to split audio: {str(e)}"
-            logging.error(error_msg)
-            import traceback
-            logging.error(f"Full traceback: {traceback.format_exc()}")
-            return None, error_msg
+            # Hand the chunk to the uploader while the next one is exported
+            yield chunk_abs_path
     
     def setup_ui(self):
         try:
+            # One Tk font per style, shared by every widget that uses it
+            self._fonts = {
+                'title': ctk.CTkFont(size=28, weight="bold"),
+                'subtitle': ctk.CTkFont(size=14),
+                'heading': ctk.CTkFont(size=16, weight="bold"),
+                'body': ctk.CTkFont(size=12),
+                'body_bold': ctk.CTkFont(size=12, weight="bold"),
+                'button': ctk.CTkFont(size=14, weight="bold")
+            }
+            
             # Configure window grid
             self.window.grid_rowconfigure(0, weight=1)
             self.window.grid_columnconfigure(0, weight=1)
@@ -294,7 +761,7 @@ class AudioTranscriberApp:
             title_label = ctk.CTkLabel(
                 main_frame, 
                 text="Audio Transcriber", 
-                font=ctk.CTkFont(size=28, weight="bold")
+                font=self._fonts['title']
             )
             title_label.pack(pady=(20, 30))
             
@@ -302,7 +769,7 @@ class AudioTranscriberApp:
             subtitle_label = ctk.CTkLabel(
                 main_frame, 
                 text="Convert your audio files to text quickly and easily",
-                font=ctk.CTkFont(size=14),
+                font=self._fonts['subtitle'],
                 text_color="gray"
             )
             subtitle_label.pack(pady=(0, 30))
@@ -314,7 +781,7 @@ class AudioTranscriberApp:
             api_label = ctk.CTkLabel(
                 api_frame, 
                 text="OpenAI API Key:",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._fonts['heading']
             )
             api_label.pack(anchor="w", padx=15, pady=(15, 5))
             
@@ -326,7 +793,7 @@ class AudioTranscriberApp:
                 textvariable=self.api_key,
                 placeholder_text="Enter your OpenAI API key (sk-...)",
                 show="*",  # Hide the API key
-                font=ctk.CTkFont(size=12)
+                font=self._fonts['body']
             )
             self.api_key_entry.pack(side="left", fill="x", expand=True, padx=(10, 5), pady=10)
             
@@ -355,7 +822,7 @@ class AudioTranscriberApp:
             audio_label = ctk.CTkLabel(
                 audio_frame, 
                 text="1. Select Audio File:",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._fonts['heading']
             )
             audio_label.pack(anchor="w", padx=15, pady=(15, 5))
             
@@ -367,7 +834,7 @@ class AudioTranscriberApp:
                 textvariable=self.audio_file_path,
                 placeholder_text="No file selected...",
                 state="readonly",
-                font=ctk.CTkFont(size=12)
+                font=self._fonts['body']
             )
             self.audio_path_entry.pack(side="left", fill="x", expand=True, padx=(10, 5), pady=10)
             
@@ -386,7 +853,7 @@ class AudioTranscriberApp:
             output_label = ctk.CTkLabel(
                 output_frame,
                 text="2. Choose Output Location:",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._fonts['heading']
             )
             output_label.pack(anchor="w", padx=15, pady=(15, 5))
             
@@ -397,14 +864,14 @@ class AudioTranscriberApp:
             folder_label = ctk.CTkLabel(
                 output_folder_frame,
                 text="Folder:",
-                font=ctk.CTkFont(size=12, weight="bold")
+                font=self._fonts['body_bold']
             )
             folder_label.pack(side="left", padx=(10, 5), pady=10)
             
             self.output_path_entry = ctk.CTkEntry(
                 output_folder_frame,
                 textvariable=self.output_directory,
-                font=ctk.CTkFont(size=12)
+                font=self._fonts['body']
             )
             self.output_path_entry.pack(side="left", fill="x", expand=True, padx=(5, 5), pady=10)
             
@@ -423,14 +890,14 @@ class AudioTranscriberApp:
             filename_label = ctk.CTkLabel(
                 output_filename_frame,
                 text="Filename:",
-                font=ctk.CTkFont(size=12, weight="bold")
+                font=self._fonts['body_bold']
             )
             filename_label.pack(side="left", padx=(10, 5), pady=10)
             
             self.output_filename_entry = ctk.CTkEntry(
                 output_filename_frame,
                 textvariable=self.output_filename,
-                font=ctk.CTkFont(size=12)
+                font=self._fonts['body']
             )
             self.output_filename_entry.pack(side="left", fill="x", expand=True, padx=(5, 5), pady=10)
             
@@ -449,7 +916,7 @@ class AudioTranscriberApp:
             transcribe_label = ctk.CTkLabel(
                 transcribe_frame,
                 text="3. Start Transcription:",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._fonts['heading']
             )
             transcribe_label.pack(anchor="w", padx=15, pady=(15, 10))
             
@@ -462,7 +929,7 @@ class AudioTranscriberApp:
             self.status_label = ctk.CTkLabel(
                 transcribe_frame,
                 text="Ready to transcribe",
-                font=ctk.CTkFont(size=12),
+                font=self._fonts['body'],
                 text_color="gray"
             )
             self.status_label.pack(padx=15, pady=(0, 10))
@@ -476,7 +943,7 @@ class AudioTranscriberApp:
                 button_frame,
                 text="Transcribe Audio",
                 command=self.start_transcription,
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=self._fonts['heading'],
                 height=40
             )
             self.transcribe_btn.pack(side="left", fill="x", expand=True, padx=(10, 5), pady=10)
@@ -486,7 +953,7 @@ class AudioTranscriberApp:
                 button_frame,
                 text="Copy to Clipboard",
                 command=self.copy_to_clipboard,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._fonts['button'],
                 height=40,
                 fg_color="green",
                 hover_color="darkgreen"
@@ -507,33 +974,30 @@ class AudioTranscriberApp:
     
     def browse_audio_file(self):
         try:
-            file_types = [
-                ("Audio Files", "*.mp3 *.mp4 *.mpeg *.mpga *.m4a *.wav *.webm"),
-                ("All Files", "*.*")
-            ]
-            
             filename = filedialog.askopenfilename(
                 title="Select Audio File",
-                filetypes=file_types
+                filetypes=self._FILE_TYPES
             )
             
             if filename:
                 abs_filename = os.path.abspath(filename)
                 
-                file_extension = Path(abs_filename).suffix.lower().lstrip('.')
-                if file_extension not in self.supported_formats:
+                file_extension = os.path.splitext(abs_filename)[1].lower()
+                if file_extension not in self.SUPPORTED_FORMATS:
                     response = messagebox.askyesno(
                         "Unsupported Format",
-                        f"The file format '.{file_extension}' might not be supported.\n"
-                        f"Supported formats: {', '.join(self.supported_formats)}\n\n"
+                        f"The file format '{file_extension}' might not be supported.\n"
+                        f"Supported formats: {self._FORMATS_DISPLAY}\n\n"
                         "Do you want to try anyway?"
                     )
                     if not response:
                         return
                 
                 # Check both file size and duration
-                file_size_mb = os.path.getsize(abs_filename) / (1024 * 1024)
-                duration, duration_error = self.get_audio_duration(abs_filename)
+                file_size_mb, duration, duration_error = self.get_audio_info(abs_filename)
+                if file_size_mb is None:
+                    messagebox.showerror("Error", duration_error)
+                    return
                 
                 if duration_error:
                     logging.warning(f"Duration check failed: {duration_error}")
@@ -555,7 +1019,7 @@ class AudioTranscriberApp:
                     )
                 
                 self.audio_file_path.set(abs_filename)
-                status_text = f"File selected: {Path(abs_filename).name} ({file_size_mb:.1f} MB, {duration_text})"
+                status_text = f"File selected: {os.path.basename(abs_filename)} ({file_size_mb:.1f} MB, {duration_text})"
                 self.status_label.configure(text=status_text)
                 logging.info(f"Audio file selected: {abs_filename} ({file_size_mb:.1f} MB, {duration_text})")
                 
@@ -582,9 +1046,17 @@ class AudioTranscriberApp:
     
     def copy_to_clipboard(self):
         try:
-            if self.transcribed_text:
+            if self.transcript_path:
+                # Read the saved transcript back only when it's actually copied
+                try:
+                    with open(self.transcript_path, 'r', encoding='utf-8') as f:
+                        transcribed_text = f.read()
+                except FileNotFoundError:
+                    messagebox.showwarning("No Text", "The saved transcription file could not be found.")
+                    return
+                
                 self.window.clipboard_clear()
-                self.window.clipboard_append(self.transcribed_text)
+                self.window.clipboard_append(transcribed_text)
                 self.window.update()
                 
                 original_text = self.copy_btn.cget("text")
@@ -599,15 +1071,57 @@ class AudioTranscriberApp:
             messagebox.showerror("Error", f"Error copying to clipboard: {e}")
     
     def cleanup_temp_files(self):
-        """Clean up all temporary files"""
-        for temp_file in self.temp_files:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                    logging.info(f"Cleaned up temporary file: {temp_file}")
-                except Exception as e:
-                    logging.warning(f"Could not clean up temporary file {temp_file}: {e}")
-        self.temp_files = []
+        """Clean up the job's temporary files in the background so the UI can reset right away"""
+        if self.temp_dir:
+            with self._cleanup_lock:
+                self._dirs_being_removed.add(self.temp_dir)
+            threading.Thread(target=self.remove_temp_dir, args=(self.temp_dir,), daemon=True).start()
+        self.temp_dir = None
+    
+    def cleanup_on_exit(self):
+        """Stop ffmpeg and remove every temporary directory still on disk before the interpreter exits"""
+        # The worker thread dies with the interpreter, so its finally blocks never stop ffmpeg;
+        # a running ffmpeg would keep writing chunks (and on Windows keep them locked against deletion)
+        process = self._ffmpeg_process
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+        
+        with self._cleanup_lock:
+            temp_dirs = set(self._dirs_being_removed)
+        if self.temp_dir:
+            temp_dirs.add(self.temp_dir)
+        for temp_dir in temp_dirs:
+            self.remove_temp_dir(temp_dir)
+    
+    def on_closing(self):
+        """Ask before closing the window while a transcription is still running"""
+        if self.is_transcribing and not messagebox.askyesno(
+                "Transcription in Progress",
+                "A transcription is still running and will be cancelled.\n\nQuit anyway?"):
+            return
+        
+        # Stop the job: no new chunks or retries, queued uploads dropped, ffmpeg stopped.
+        # Uploads already in flight can't be interrupted and finish before the process exits.
+        self._cancel_event.set()
+        executor = self._upload_executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        process = self._ffmpeg_process
+        if process is not None and process.poll() is None:
+            process.kill()
+        self.window.destroy()
+    
+    def remove_temp_dir(self, temp_dir):
+        """Delete a temporary directory and every chunk in it"""
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        if os.path.exists(temp_dir):
+            # Stays tracked, so the exit handler tries again
+            logging.warning(f"Could not fully clean up temporary directory: {temp_dir}")
+        else:
+            with self._cleanup_lock:
+                self._dirs_being_removed.discard(temp_dir)
+            logging.info(f"Cleaned up temporary directory: {temp_dir}")
     
     def validate_inputs(self):
         # Check if API key is set and client is initialized
@@ -620,7 +1134,7 @@ class AudioTranscriberApp:
             return False
         
         abs_audio_path = os.path.abspath(self.audio_file_path.get())
-        if not os.path.exists(abs_audio_path):
+        if self.cached_stat(abs_audio_path) is None:
             messagebox.showerror("Error", f"The selected audio file does not exist: {abs_audio_path}")
             return False
         
@@ -630,7 +1144,7 @@ class AudioTranscriberApp:
             return False
         
         abs_output_dir = os.path.abspath(output_dir)
-        if not os.path.exists(abs_output_dir):
+        if self.cached_stat(abs_output_dir) is None:
             try:
                 os.makedirs(abs_output_dir)
                 logging.info(f"Created output directory: {abs_output_dir}")
@@ -653,30 +1167,38 @@ class AudioTranscriberApp:
         if self.is_transcribing:
             return
         
+        # Paths checked while validating are stat'ed once and reused by the analysis step
+        self._stat_cache = {}
         if not self.validate_inputs():
+            self._stat_cache = None
             return
         
         self.copy_btn.pack_forget()
+        self._cancel_event.clear()
         self.is_transcribing = True
         self.transcribe_btn.configure(text="Transcribing...", state="disabled")
         self.progress_bar.set(0)
         
-        thread = threading.Thread(target=self.transcribe_audio)
+        # Open the HTTPS connection while the audio is analyzed and split
+        threading.Thread(target=self.warm_up_connection, daemon=True).start()
+        
+        # Resolve the job's paths once here; validate_inputs already added the .txt extension
+        original_audio_path = os.path.abspath(self.audio_file_path.get())
+        output_dir = os.path.abspath(self.output_directory.get())
+        output_filename = self.output_filename.get().strip()
+        
+        thread = threading.Thread(
+            target=self.transcribe_audio,
+            args=(original_audio_path, output_dir, output_filename)
+        )
         thread.daemon = True
         thread.start()
     
-    def transcribe_audio(self):
+    def transcribe_audio(self, original_audio_path, output_dir, output_filename):
         try:
             self.update_status("Analyzing audio file...")
             self.update_progress(0.05)
             
-            original_audio_path = os.path.abspath(self.audio_file_path.get())
-            output_dir = os.path.abspath(self.output_directory.get())
-            output_filename = self.output_filename.get()
-            
-            if not output_filename.lower().endswith('.txt'):
-                output_filename += '.txt'
-            
             output_path = os.path.join(output_dir, output_filename)
             
             logging.info(f"Starting transcription for: {original_audio_path}")
@@ -689,84 +1211,94 @@ class AudioTranscriberApp:
                 messagebox.showerror("File Analysis Error", error)
                 return
             
-            files_to_transcribe = []
-            
-            if needs_split:
+            if not needs_split:
+                # File is within limits: upload it as-is from this thread, no pool or chunk bookkeeping.
+                # A failure here is reported by the handler below rather than saved as the transcript.
+                self.update_status("File within limits, uploading to OpenAI...")
+                self.update_progress(0.3)
+                transcript = self.call_with_retry(self.request_transcription, original_audio_path)
+                all_transcripts = [transcript.text]
+            else:
                 duration_minutes = duration / 60 if duration else 0
                 self.update_status(f"File exceeds limits ({file_size_mb:.1f}MB, {duration_minutes:.1f}min), splitting...")
                 self.update_progress(0.1)
                 
-                # Split the MP3 file (no FFmpeg needed)
-                chunks, error = self.split_mp3_file(original_audio_path)
-                if error:
+                # All chunks for this job go in one directory, removed as a whole afterwards
+                self.temp_dir = tempfile.mkdtemp(prefix="transcriber_")
+                
+                # Only too big, not too long: one transcode of the whole file fits, no split needed
+                if duration <= self.max_duration_seconds:
+                    max_chunk_seconds = math.ceil(duration) + 1
+                else:
+                    max_chunk_seconds = 1350
+                
+                # Chunks are uploaded while the later ones are still being produced
+                if FFMPEG_PATH:
+                    chunk_source = self.stream_mp3_chunks(original_audio_path, self.temp_dir, max_chunk_seconds)
+                    expected_chunks = max(1, math.ceil(duration / self.get_segment_time(max_chunk_seconds)))
+                elif os.path.splitext(original_audio_path)[1].lower() in MP3_EXTENSIONS:
+                    chunk_source = self.stream_mp3_chunks_by_frames(original_audio_path, self.temp_dir, max_chunk_seconds)
+                    expected_chunks = max(1, math.ceil(duration / max_chunk_seconds))
+                else:
+                    chunk_source = self.stream_wav_chunks_pydub(original_audio_path, self.temp_dir, max_chunk_seconds)
+                    expected_chunks = max(1, math.ceil(duration / max_chunk_seconds))
+                
+                self.update_progress(0.3)
+                
+                # Transcribe all files; chunks are independent network-bound requests,
+                # so several are uploaded at once. Results are collected in chunk order.
+                self.completed_chunks = 0
+                futures = []
+                
+                executor = self._upload_executor = ThreadPoolExecutor(max_workers=self.max_concurrent_uploads)
+                try:
+                    for i, file_path in enumerate(chunk_source):
+                        if self._cancel_event.is_set():
+                            break
+                        futures.append(executor.submit(self.transcribe_chunk, i, file_path, expected_chunks))
+                        self.update_status(f"Transcribing chunk {i+1}...")
+                except Exception as e:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    if self._cancel_event.is_set():
+                        return  # ffmpeg was killed because the window closed
+                    logging.error(f"Splitting failed: {e}")
                     self.update_status("Splitting failed")
-                    messagebox.showerror("Splitting Error", f"Failed to split audio file:\n{error}")
+                    messagebox.showerror("Splitting Error", f"Failed to split audio file:\n{e}")
                     return
                 
-                files_to_transcribe = chunks
-                self.update_status(f"Split into {len(chunks)} chunks, transcribing...")
-                logging.info(f"Audio split into {len(chunks)} chunks")
-            else:
-                # File is within limits, use as-is
-                files_to_transcribe = [original_audio_path]
-                self.update_status("File within limits, uploading to OpenAI...")
-            
-            self.update_progress(0.3)
-            
-            # Transcribe all files
-            all_transcripts = []
-            total_files = len(files_to_transcribe)
+                if self._cancel_event.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
+                
+                # on_closing cancels whatever hasn't started yet, so don't wait on cancelled futures
+                executor.shutdown(wait=True)
+                if self._cancel_event.is_set():
+                    return
+                all_transcripts = [future.result() for future in futures]
             
-            for i, file_path in enumerate(files_to_transcribe):
-                try:
-                    abs_file_path = os.path.abspath(file_path)
-                    self.update_status(f"Transcribing chunk {i+1}/{total_files}...")
-                    
-                    logging.info(f"Transcribing file: {abs_file_path}")
-                    logging.info(f"File exists: {os.path.exists(abs_file_path)}")
-                    logging.info(f"File size: {os.path.getsize(abs_file_path)} bytes")
-                    
-                    with open(abs_file_path, "rb") as audio_file:
-                        transcript = self.client.audio.transcriptions.create(
-                            model="gpt-4o-transcribe",
-                            file=audio_file
-                        )
-                    
-                    all_transcripts.append(transcript.text)
-                    
-                    # Update progress
-                    progress = 0.3 + (0.5 * (i + 1) / total_files)
-                    self.update_progress(progress)
-                    
-                    logging.info(f"Transcribed chunk {i+1}/{total_files} successfully")
-                    
-                except Exception as e:
-                    logging.error(f"Failed to transcribe chunk {i+1}: {e}")
-                    all_transcripts.append(f"[Error transcribing chunk {i+1}: {str(e)}]")
+            total_files = len(all_transcripts)
+            if total_files > 1:
+                logging.info(f"Audio split into {total_files} chunks")
             
             self.update_progress(0.8)
             self.update_status("Combining transcripts and saving...")
             
-            # Combine all transcripts
-            if len(all_transcripts) == 1:
-                combined_transcript = all_transcripts[0]
-            else:
-                # Add chunk separators for clarity
-                combined_transcript = ""
-                for i, transcript in enumerate(all_transcripts):
-                    if i > 0:
-                        combined_transcript += f"\n\n--- Part {i+1} ---\n\n"
-                    combined_transcript += transcript
+            # Write the parts straight into the file (1MB buffer) rather than building a combined copy
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(all_transcripts[0])
+                for i, transcript in enumerate(all_transcripts[1:], start=1):
+                    # Add chunk separators for clarity
+                    f.write(f"\n\n--- Part {i+1} ---\n\n")
+                    f.write(transcript)
             
-            self.transcribed_text = combined_transcript
-            
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(combined_transcript)
+            self.transcript_path = output_path
             
             self.update_progress(1.0)
             self.update_status("Transcription completed successfully!")
             
+            # Persist this file's probed duration along with the rest of the config
+            self.window.after(0, self.save_config)
+            
             if total_files > 1:
                 logging.info(f"Transcription completed: {total_files} chunks combined into {output_filename}")
             else:
@@ -784,24 +1316,29 @@ class AudioTranscriberApp:
             )
             
             if response:
-                if os.name == 'nt':  # Windows
-                    os.startfile(output_dir)
-                elif os.name == 'posix':  # macOS and Linux
-                    os.system(f'open "{output_dir}"')
+                try:
+                    self._open_folder(output_dir)
+                except OSError as e:
+                    # The transcript is saved; a missing file manager isn't a transcription error
+                    logging.warning(f"Could not open output folder: {e}")
             
         except Exception as e:
             error_msg = str(e)
             logging.error(f"Transcription error: {error_msg}")
+            if self._cancel_event.is_set():
+                return  # The window is gone; nobody to show a dialog to
             
             self.update_status("Transcription failed")
             self.update_progress(0)
             
-            if "rate limit" in error_msg.lower():
+            # The SDK was loaded when the client was created, so this doesn't import anything
+            openai = get_openai_module()
+            if isinstance(e, openai.RateLimitError):
                 messagebox.showerror(
                     "Rate Limit Exceeded",
                     "Too many requests to OpenAI. Please wait a moment and try again."
                 )
-            elif "authentication" in error_msg.lower() or "api" in error_msg.lower():
+            elif isinstance(e, (openai.AuthenticationError, openai.PermissionDeniedError, openai.APIConnectionError)):
                 messagebox.showerror(
                     "API Error",
                     "There's an issue with the API key or connection. Please check your API key."
@@ -814,18 +1351,119 @@ class AudioTranscriberApp:
         
         finally:
             self.cleanup_temp_files()
+            self._stat_cache = None
             self.is_transcribing = False
-            self.window.after(0, self.reset_ui)
+            self._upload_executor = None
+            if not self._cancel_event.is_set():
+                self.window.after(0, self.reset_ui)
+    
+    def warm_up_connection(self):
+        """Make a cheap API call so the first upload reuses an established TLS connection"""
+        try:
+            # with_options copies share the client's connection pool
+            self.client.with_options(timeout=5).models.list()
+        except Exception as e:
+            logging.info(f"Connection warm-up failed (not critical): {e}")
+    
+    def request_transcription(self, file_path):
+        """Upload one audio file to OpenAI and return the transcription"""
+        self.wait_for_request_slot()
+        # 1MB buffer: the multipart upload reads the whole chunk, so use fewer, larger reads
+        with open(file_path, "rb", buffering=1 << 20) as audio_file:
+            return self.client.audio.transcriptions.create(
+                model="gpt-4o-transcribe",
+                file=audio_file
+            )
+    
+    def wait_for_request_slot(self):
+        """Block until this thread may start a request, keeping starts 60/rpm_limit seconds apart"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + 60.0 / self.rpm_limit
+        # Sleep outside the lock; each caller has already reserved its own slot
+        if start > now:
+            time.sleep(start - now)
+    
+    def call_with_retry(self, fn, *args, **kwargs):
+        """Call fn, retrying transient OpenAI errors with jittered exponential backoff"""
+        openai = get_openai_module()
+        for attempt in range(self.max_retries + 1):
+            if self._cancel_event.is_set():
+                raise RuntimeError("Transcription cancelled")
+            try:
+                return fn(*args, **kwargs)
+            except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:  # Connection errors include timeouts
+                # An exhausted quota is also a 429, but waiting won't fix it
+                if attempt == self.max_retries or getattr(e, 'code', None) == 'insufficient_quota':
+                    raise
+                delay = min(30, 2 ** attempt + random.random())
+                logging.warning(f"OpenAI request failed on attempt {attempt+1} ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def transcribe_chunk(self, index, file_path, total_files):
+        """Transcribe a single file, retrying transient API errors before giving up"""
+        try:
+            logging.info(f"Transcribing file: {file_path}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                chunk_stat = _safe_stat(file_path)
+                if chunk_stat is None:
+                    logging.debug("File exists: False")
+                else:
+                    logging.debug(f"File size: {chunk_stat.st_size} bytes")
+            
+            transcript = self.call_with_retry(self.request_transcription, file_path)
+            text = transcript.text
+            logging.info(f"Transcribed chunk {index+1}/{total_files} successfully")
+            
+        except Exception as e:
+            logging.error(f"Failed to transcribe chunk {index+1}: {e}")
+            text = f"[Error transcribing chunk {index+1}: {str(e)}]"
+        
+        # Update progress; total_files is an estimate while chunks are still being produced
+        with self.progress_lock:
+            self.completed_chunks += 1
+            completed = self.completed_chunks
+        total_files = max(total_files, completed)
+        self.update_progress(0.3 + (0.5 * completed / total_files))
+        if total_files > 1:
+            self.update_status(f"Transcribed {completed}/{total_files} chunks...")
+        
+        return text
     
     def show_copy_button(self):
         """Show the copy button after successful transcription"""
         self.copy_btn.pack(side="right", fill="x", expand=True, padx=(5, 10), pady=10)
     
     def update_status(self, message):
-        self.window.after(0, lambda: self.status_label.configure(text=message))
+        with self._ui_lock:
+            self._pending_status = message
+            self.schedule_ui_flush()
     
     def update_progress(self, value):
-        self.window.after(0, lambda: self.progress_bar.set(value))
+        with self._ui_lock:
+            self._pending_progress = value
+            self.schedule_ui_flush()
+    
+    def schedule_ui_flush(self):
+        """Queue one Tk callback 50ms out for all updates posted until it runs (hold _ui_lock)"""
+        if self._cancel_event.is_set():
+            return  # The window has been destroyed
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.window.after(50, self.flush_ui_updates)
+    
+    def flush_ui_updates(self):
+        """Apply the latest pending status and progress on the Tk thread"""
+        with self._ui_lock:
+            status, progress = self._pending_status, self._pending_progress
+            self._pending_status = self._pending_progress = None
+            self._ui_flush_scheduled = False
+        
+        if status is not None:
+            self.status_label.configure(text=status)
+        if progress is not None:
+            self.progress_bar.set(progress)
     
     def reset_ui(self):
         self.transcribe_btn.configure(text="Transcribe Audio", state="normal")